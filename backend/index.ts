@@ -12,6 +12,7 @@ import ebirdProxy from "routes/ebird-proxy.js";
 import invites from "routes/invites.js";
 import { HTTPException } from "hono/http-exception";
 import { cors } from "hono/cors";
+import { compress } from "hono/compress";
 
 const app = new Hono();
 
@@ -21,6 +22,16 @@ if (process.env.CORS_ORIGINS) {
   console.error("CORS_ORIGINS is not set");
 }
 
+// Responses can be gzipped or not depending on Accept-Encoding, so shared caches must key on it.
+// Registered before compress() so it runs after compression on the way out.
+app.use("*", async (c, next) => {
+  await next();
+  c.header("Vary", "Accept-Encoding", { append: true });
+});
+
+// Target lists are large, repetitive JSON and compress well
+app.use("*", compress());
+
 app.route("/v1/profile", profile);
 app.route("/v1/account", account);
 app.route("/v1/trips", trips);
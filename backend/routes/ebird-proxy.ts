@@ -17,9 +17,12 @@ ebirdProxy.get("/:path{.*}", async (c) => {
   const url: string = `https://api.ebird.org/v2/${path}?${searchParams.toString()}`;
 
   const response = await fetch(url);
-  const data = await response.json();
-
-  return c.json(data);
+  // Stream the upstream body straight through rather than parsing and re-serializing it,
+  // keeping its status and content type so upstream errors still surface as errors
+  return new Response(response.body, {
+    status: response.status,
+    headers: { "Content-Type": response.headers.get("Content-Type") ?? "application/json" },
+  });
 });
 
 export default ebirdProxy;
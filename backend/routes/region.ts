@@ -50,9 +50,11 @@ region.get("/:region/species", async (c) => {
   }
 
   const json = await response.json();
+  const seenCodes = new Set<string>();
   const formatted: SpeciesObservation[] = json.reduce((acc: SpeciesObservation[], it: any) => {
     const code = it.speciesCode;
-    if (!acc.some((item) => item.code === code)) {
+    if (!seenCodes.has(code)) {
+      seenCodes.add(code);
       acc.push({
         code: code,
         name: it.comName,
@@ -90,7 +90,7 @@ hotspots.get("/:hotspotId/targets", async (c) => {
   await connect();
   const [trip, targetList] = await Promise.all([
     Trip.findById(tripId),
-    TargetList.findOne({ type: TargetListType.hotspot, tripId, hotspotId }).sort({ createdAt: -1 }),
+    TargetList.findOne({ type: TargetListType.hotspot, tripId, hotspotId }).sort({ createdAt: -1 }).lean(),
   ]);
   if (!trip) throw new HTTPException(404, { message: "Trip not found" });
   if (!trip.isPublic && (!session?.uid || !trip.userIds.includes(session.uid)))
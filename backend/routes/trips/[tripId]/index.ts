@@ -160,7 +160,7 @@ trip.get("/all-hotspot-targets", async (c) => {
   await connect();
   const [trip, results] = await Promise.all([
     Trip.findById(tripId),
-    TargetList.find({ type: TargetListType.hotspot, tripId }).sort({ createdAt: -1 }),
+    TargetList.find({ type: TargetListType.hotspot, tripId }).sort({ createdAt: -1 }).lean(),
   ]);
 
   if (!trip) {
@@ -222,12 +222,12 @@ trip.get("/export", async (c) => {
     throw new HTTPException(404, { message: "Trip not found" });
   }
 
-  const lifelist = profile?.lifelist || [];
+  const lifelist = new Set(profile?.lifelist || []);
 
   const filteredTargets = hotspotTargets.map((target) => {
-    const needs = target.items?.filter((it) => !lifelist?.includes(it.code));
-    const filtered = needs?.filter((it) => it.percentYr >= 5);
-    const items = filtered?.sort((a, b) => b.percentYr - a.percentYr);
+    const items = target.items
+      ?.filter((it) => it.percentYr >= 5 && !lifelist.has(it.code))
+      .sort((a, b) => b.percentYr - a.percentYr);
     return { ...target, items };
   });
 
@@ -16,7 +16,7 @@ targets.get("/", async (c) => {
   await connect();
   const [trip, targetList] = await Promise.all([
     Trip.findById(tripId),
-    TargetList.findOne({ type: TargetListType.trip, tripId }).sort({ createdAt: -1 }),
+    TargetList.findOne({ type: TargetListType.trip, tripId }).sort({ createdAt: -1 }).lean(),
   ]);
 
   if (!trip) throw new HTTPException(404, { message: "Trip not found" });
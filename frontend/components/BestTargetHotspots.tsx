@@ -5,6 +5,7 @@ import { useTrip } from "providers/trip";
 import { useModal } from "providers/modals";
 import FilterTabs from "components/FilterTabs";
 import { HOTSPOT_TARGET_CUTOFF } from "lib/config";
+import { rankHotspotsForSpecies } from "lib/helpers";
 
 type Props = {
   speciesCode: string;
@@ -31,30 +32,16 @@ export default function BestTargetHotspots({ speciesCode, speciesName, className
       </Alert>
     );
 
-  const topHotspots = allTargets
-    .filter(
-      ({ items, hotspotId }) =>
-        !!hotspotId &&
-        locationIds.includes(hotspotId) &&
-        items.find(
-          (item) =>
-            item.code === speciesCode &&
-            (filter === "year" ? item.percentYr >= HOTSPOT_TARGET_CUTOFF : item.percent >= HOTSPOT_TARGET_CUTOFF)
-        )
-    )
-    .map(({ items, hotspotId, N, yrN }) => {
-      const hotspot = trip?.hotspots?.find((it) => it.id === hotspotId);
-      const targetInfo = items.find((item) => item.code === speciesCode);
-      return {
-        locationId: hotspotId,
-        N,
-        yrN,
-        percent: targetInfo?.percent || 0,
-        percentYr: targetInfo?.percentYr || 0,
-        hotspot,
-      };
-    })
-    .sort((a, b) => (filter === "year" ? b.percentYr - a.percentYr : b.percent - a.percent));
+  const hotspots = trip?.hotspots || [];
+  const hotspotsById = new Map(hotspots.map((it) => [it.id, it] as const));
+  const topHotspots = rankHotspotsForSpecies(
+    speciesCode,
+    allTargets,
+    locationIds,
+    hotspots,
+    (percent) => percent >= HOTSPOT_TARGET_CUTOFF,
+    filter === "year" ? "percentYr" : "percent"
+  );
 
   const slicedHotspots = isExpanded ? topHotspots : topHotspots.slice(0, 5);
   if (!slicedHotspots?.length) return <Alert style="warning">No hotspots found for {speciesName}</Alert>;
@@ -75,11 +62,12 @@ export default function BestTargetHotspots({ speciesCode, speciesName, className
         />
       </div>
       <div className="flex flex-col gap-2">
-        {slicedHotspots.map(({ hotspot, locationId, N, yrN, percent, percentYr }, index) => {
+        {slicedHotspots.map(({ hotspotId, N, yrN, percent, percentYr }, index) => {
+          const hotspot = hotspotsById.get(hotspotId);
           const actualPercent = filter === "year" ? percentYr : percent;
           return (
             <div
-              key={locationId}
+              key={hotspotId}
               className="border-t border-gray-100 py-1.5 text-gray-500/80 text-[13px] grid gap-2 grid-cols-1 sm:grid-cols-5 mx-1 cursor-pointer group"
               onClick={() => open("hotspot", { hotspot })}
               title="Click to view hotspot"
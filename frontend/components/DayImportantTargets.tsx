@@ -13,6 +13,7 @@ import {
   getDaySpeciesImportance,
   getBestHotspotsForSpecies,
   getAllHotspotsForSpecies,
+  getTargetPercent,
 } from "lib/helpers";
 import Icon from "components/Icon";
 import MerlinkLink from "components/MerlinLink";
@@ -34,14 +35,6 @@ type HotspotSpecies = {
   species: SpeciesAtHotspot[];
 };
 
-function getSpeciesName(code: string, allTargets: { items: { code: string; name: string }[] }[]): string {
-  for (const t of allTargets) {
-    const item = t.items.find((it) => it.code === code);
-    if (item) return item.name;
-  }
-  return code;
-}
-
 const COLLAPSED_SPECIES_PREVIEW = 4;
 
 export default function DayImportantTargets({ day }: Props) {
@@ -71,9 +64,16 @@ export default function DayImportantTargets({ day }: Props) {
     [allTargets, trip?.itinerary, dayIndex]
   );
 
+  const speciesNames = React.useMemo(() => {
+    const names = new Map<string, string>();
+    for (const t of allTargets ?? []) {
+      for (const item of t.items) names.set(item.code, item.name);
+    }
+    return names;
+  }, [allTargets]);
+
   const getPercentOnDay = React.useCallback(
-    (hotspotId: string, code: string): number =>
-      allTargets?.find((t) => t.hotspotId === hotspotId)?.items.find((it) => it.code === code)?.percent ?? 0,
+    (hotspotId: string, code: string): number => getTargetPercent(allTargets ?? [], hotspotId, code),
     [allTargets]
   );
 
@@ -104,7 +104,7 @@ export default function DayImportantTargets({ day }: Props) {
 
         species.push({
           code,
-          name: getSpeciesName(code, allTargets),
+          name: speciesNames.get(code) ?? code,
           isBestAtThisHotspot: isBestAtThisHotspotOnDay,
           isCritical: imp.isCritical,
         });
@@ -121,7 +121,17 @@ export default function DayImportantTargets({ day }: Props) {
     }
 
     return result;
-  }, [allTargets, hotspotsInOrder, trip?.hotspots, trip?.itinerary, dayIndex, dayImportance, getPercentOnDay, lifelist]);
+  }, [
+    allTargets,
+    hotspotsInOrder,
+    trip?.hotspots,
+    trip?.itinerary,
+    dayIndex,
+    dayImportance,
+    getPercentOnDay,
+    speciesNames,
+    lifelist,
+  ]);
 
   const locationIds = trip?.hotspots?.map((h) => h.id) ?? [];
   const hotspots = trip?.hotspots ?? [];
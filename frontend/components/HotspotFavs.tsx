@@ -3,6 +3,7 @@ import FavButton from "components/FavButton";
 import MerlinkLink from "components/MerlinLink";
 import { useTrip } from "providers/trip";
 import { useHotspotTargets } from "providers/hotspot-targets";
+import { getItemsByCode, getTargetsByHotspot } from "lib/helpers";
 
 type Props = {
   hotspotId: string;
@@ -22,13 +23,12 @@ export default function HotspotFavs({ hotspotId }: Props) {
   const favCodes = trip?.targetStars ?? [];
   if (!favCodes.length) return null;
 
-  const hotspotTarget = allTargets?.find((t) => t.hotspotId === hotspotId);
-  const hotspotItems = hotspotTarget?.items ?? [];
+  const hotspotTarget = getTargetsByHotspot(allTargets).get(hotspotId);
   const tripTargetItems = targets?.items ?? [];
 
   const favsWithDisplay: FavDisplay[] = favCodes
     .map((code) => {
-      const atHotspot = hotspotItems.find((it) => it.code === code);
+      const atHotspot = hotspotTarget ? getItemsByCode(hotspotTarget).get(code) : undefined;
       const atTrip = tripTargetItems.find((it) => it.code === code);
       return {
         code,
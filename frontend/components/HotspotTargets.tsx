@@ -6,8 +6,8 @@ import FilterTabs from "components/FilterTabs";
 import { useProfile } from "providers/profile";
 import { useHotspotTargets } from "providers/hotspot-targets";
 import Alert from "components/Alert";
-import { HOTSPOT_TARGET_CUTOFF } from "lib/config";
-import { getHotspotSpeciesImportance } from "lib/helpers";
+import { HOTSPOT_TARGET_CUTOFF, TARGETS_API_URL } from "lib/config";
+import { getHotspotSpeciesImportance, getTargetsByHotspot } from "lib/helpers";
 import { useQueryClient } from "@tanstack/react-query";
 import useMutation from "hooks/useMutation";
 
@@ -30,7 +30,7 @@ export default function HotspotTargets({ hotspotId, onSpeciesClick, onAddToTrip
   const isDownloading = pendingLocIds.includes(hotspotId);
   const isFailed = failedLocIds.includes(hotspotId);
 
-  const items = allTargets.find((it) => it.hotspotId === hotspotId)?.items;
+  const items = getTargetsByHotspot(allTargets).get(hotspotId)?.items;
 
   const importanceMap = React.useMemo(
     () => getHotspotSpeciesImportance(allTargets, hotspotId),
@@ -53,6 +53,8 @@ export default function HotspotTargets({ hotspotId, onSpeciesClick, onAddToTrip
     method: "PATCH",
     onMutate: () => setIsPending(true),
     onSuccess: async () => {
+      // Bypass the cached download so the reset fetches fresh targets
+      queryClient.removeQueries({ queryKey: [TARGETS_API_URL, { region: hotspotId }] });
       await queryClient.invalidateQueries({ queryKey: [`/trips/${trip?._id}`] });
       await queryClient.invalidateQueries({ queryKey: [`/trips/${trip?._id}/all-hotspot-targets`] });
       setIsPending(false);
@@ -1,5 +1,6 @@
 import { Target } from "@birdplan/shared";
 import { useQuery } from "@tanstack/react-query";
+import { TARGETS_API_URL } from "lib/config";
 
 type PropsT = {
   region?: string;
@@ -16,7 +17,7 @@ export default function useDownloadTargets({ region, startMonth, endMonth, enabl
     yrN: number;
   }>({
     queryKey: [
-      "https://faas-nyc1-2ef2e6cc.doserverless.co/api/v1/web/fn-6c6abe6c-b02b-4b79-a86e-f7633e99a025/targets/get",
+      TARGETS_API_URL,
       { startMonth: startMonth || 1, endMonth: endMonth || 12, region, ...(cutoff ? { cutoff } : {}) },
     ],
     refetchOnWindowFocus: false,
@@ -1,6 +1,7 @@
 import React from "react";
 import { useQuery } from "@tanstack/react-query";
 import { EBIRD_BASE_URL } from "lib/config";
+import { getItemsByCode } from "lib/helpers";
 import { TargetList } from "@birdplan/shared";
 
 type Obs = {
@@ -148,7 +149,7 @@ export default function useFetchSpeciesObs({ region, code, allTargets, showPerso
 
     for (const target of allTargets) {
       if (!target.hotspotId) continue;
-      const speciesItem = target.items.find((item) => item.code === code);
+      const speciesItem = getItemsByCode(target).get(code);
       if (speciesItem) {
         // Use percent (trip date range) rather than percentYr (all year)
         map.set(target.hotspotId, speciesItem.percent);
@@ -5,18 +5,51 @@ import { useTrip } from "providers/trip";
 import { useWindowActive } from "hooks/useWindowActive";
 import { useQueryClient } from "@tanstack/react-query";
 import useRealtime from "hooks/useRealtimeStatus";
+import { TARGETS_API_URL } from "lib/config";
 
 const CUTOFF = "5"; // Percent
 const RETRY_LIMIT = 1;
+const CONCURRENCY = 4; // Stay under the browser's 6 connections per host in case the endpoint is HTTP/1.1 only
+const CACHE_TIME = 10 * 60 * 1000; // 10 minutes
+const REQUESTS_PER_SECOND = 5;
+const RETRY_DELAY = 1000; // ms
+const MAX_RETRY_AFTER = 30000; // ms
+
+// Retry-After is either a number of seconds or an HTTP date; capped so a long value can't stall every download
+const parseRetryAfter = (value: string | null): number | undefined => {
+  if (!value) return undefined;
+  const seconds = Number(value);
+  const delay = Number.isNaN(seconds) ? Date.parse(value) - Date.now() : seconds * 1000;
+  return Number.isNaN(delay) ? undefined : Math.min(Math.max(0, delay), MAX_RETRY_AFTER);
+};
+
+class TargetsRequestError extends Error {
+  retryAfter?: number; // ms
+
+  constructor(response: Response) {
+    super(response.statusText);
+    this.retryAfter = parseRetryAfter(response.headers.get("Retry-After"));
+  }
+}
+
+// Honor the server's Retry-After when given, otherwise wait a jittered 1-2s before the single retry.
+// The targets endpoint is cross-origin, so Retry-After is only readable if it's listed in
+// Access-Control-Expose-Headers; until the endpoint exposes it this branch never runs.
+const getRetryDelay = (error: unknown) => {
+  const retryAfter = error instanceof TargetsRequestError ? error.retryAfter : undefined;
+  if (retryAfter !== undefined) return retryAfter;
+  return RETRY_DELAY + Math.random() * RETRY_DELAY;
+};
 
 export default function useTargetsDownloadManager() {
   const { trip, canEdit } = useTrip();
-  const [downloadingLocId, setDownloadingLocId] = useState<string | null>(null);
+  const [downloadingLocIds, setDownloadingLocIds] = useState<string[]>([]);
 
   const processedHotspotsRef = useRef(new Set<string>());
   const pendingHotspotsRef = useRef(new Set<string>());
   const failedAttemptsRef = useRef(new Map<string, number>());
   const downloadingRef = useRef(false);
+  const nextRequestAtRef = useRef(0);
   const windowIsFocused = useWindowActive({
     onFocus: () => {
       processedHotspotsRef.current.clear();
@@ -36,15 +69,43 @@ export default function useTargetsDownloadManager() {
     downloadPendingTargets();
   };
 
-  const fetchTargetsForHotspot = async (locId: string): Promise<TargetList> => {
-    const url = `https://faas-nyc1-2ef2e6cc.doserverless.co/api/v1/web/fn-6c6abe6c-b02b-4b79-a86e-f7633e99a025/targets/get?startMonth=${trip?.startMonth}&endMonth=${trip?.endMonth}&region=${locId}&cutoff=${CUTOFF}`;
-    const response = await fetch(url);
-    if (!response.ok) throw new Error(response.statusText);
-    const data = await response.json();
-    if (!data.items) throw new Error("Invalid response");
-    return data;
+  // Spaces out request starts across all workers so concurrent downloads stay under the rate limit
+  const waitForRateLimit = async () => {
+    const now = Date.now();
+    const startAt = Math.max(now, nextRequestAtRef.current);
+    nextRequestAtRef.current = startAt + 1000 / REQUESTS_PER_SECOND;
+    if (startAt > now) await new Promise((resolve) => setTimeout(resolve, startAt - now));
   };
 
+  // Responses are kept briefly so removing and re-adding a hotspot doesn't hit the network again.
+  // The saved copy lives in all-hotspot-targets, so these aren't kept long enough to bloat the persisted cache.
+  const fetchTargetsForHotspot = (locId: string): Promise<TargetList> =>
+    queryClient.fetchQuery({
+      queryKey: [
+        TARGETS_API_URL,
+        { startMonth: trip?.startMonth, endMonth: trip?.endMonth, region: locId, cutoff: CUTOFF },
+      ],
+      queryFn: async () => {
+        await waitForRateLimit();
+        const url = `${TARGETS_API_URL}?startMonth=${trip?.startMonth}&endMonth=${trip?.endMonth}&region=${locId}&cutoff=${CUTOFF}`;
+        const response = await fetch(url);
+        if (!response.ok) {
+          const error = new TargetsRequestError(response);
+          // The whole endpoint is throttled, so hold back every worker, not just this one
+          if (error.retryAfter !== undefined) {
+            nextRequestAtRef.current = Math.max(nextRequestAtRef.current, Date.now() + error.retryAfter);
+          }
+          throw error;
+        }
+        const data = await response.json();
+        if (!data.items) throw new Error("Invalid response");
+        return data;
+      },
+      staleTime: CACHE_TIME,
+      gcTime: CACHE_TIME,
+      retry: false, // Retries are handled by the download manager
+    });
+
   const handleAddTargets = async (locId: string, data: TargetList) => {
     if (!trip) return;
     try {
@@ -68,35 +129,43 @@ export default function useTargetsDownloadManager() {
     ]);
   };
 
+  const downloadTargets = async (locId: string) => {
+    setDownloadingLocIds((prev) => [...prev, locId]);
+    try {
+      const targets: TargetList = await fetchTargetsForHotspot(locId);
+      if (targets) {
+        await handleAddTargets(locId, targets);
+        processedHotspotsRef.current.add(locId);
+        failedAttemptsRef.current.delete(locId);
+      }
+    } catch (error) {
+      console.error(`Failed to download targets for ${locId}:`, error);
+      const attempts = failedAttemptsRef.current.get(locId) || 0;
+      if (attempts < RETRY_LIMIT) {
+        await new Promise((resolve) => setTimeout(resolve, getRetryDelay(error)));
+        pendingHotspotsRef.current.add(locId);
+        failedAttemptsRef.current.set(locId, attempts + 1);
+      }
+    }
+    setDownloadingLocIds((prev) => prev.filter((it) => it !== locId));
+  };
+
   const downloadPendingTargets = async () => {
     if (downloadingRef.current || isPaused) return;
     downloadingRef.current = true;
 
-    while (pendingHotspotsRef.current.size > 0) {
-      const locId = pendingHotspotsRef.current.values().next().value;
-      if (!locId) break;
-
-      setDownloadingLocId(locId);
-      pendingHotspotsRef.current.delete(locId);
-
-      try {
-        const targets: TargetList = await fetchTargetsForHotspot(locId);
-        if (targets) {
-          await handleAddTargets(locId, targets);
-          processedHotspotsRef.current.add(locId);
-          failedAttemptsRef.current.delete(locId);
-        }
-      } catch (error) {
-        console.error(`Failed to download targets for ${locId}:`, error);
-        const attempts = failedAttemptsRef.current.get(locId) || 0;
-        if (attempts < RETRY_LIMIT) {
-          pendingHotspotsRef.current.add(locId);
-          failedAttemptsRef.current.set(locId, attempts + 1);
-        }
+    // Each worker pulls the next pending hotspot until the queue is drained
+    const worker = async () => {
+      while (pendingHotspotsRef.current.size > 0) {
+        const locId = pendingHotspotsRef.current.values().next().value;
+        if (!locId) break;
+        pendingHotspotsRef.current.delete(locId);
+        await downloadTargets(locId);
       }
-    }
+    };
+
+    await Promise.all(Array.from({ length: CONCURRENCY }, worker));
 
-    setDownloadingLocId(null);
     downloadingRef.current = false;
   };
 
@@ -118,12 +187,11 @@ export default function useTargetsDownloadManager() {
     }
   }, [isPaused, canEdit, hotspotsString]);
 
-  const pendingLocIds = Array.from(pendingHotspotsRef.current);
-  if (downloadingLocId) pendingLocIds.push(downloadingLocId);
+  const pendingLocIds = [...Array.from(pendingHotspotsRef.current), ...downloadingLocIds];
 
   const failedLocIds = Array.from(failedAttemptsRef.current.entries())
     .filter(([_, attempts]) => attempts >= RETRY_LIMIT)
     .map(([locId]) => locId);
 
-  return { pendingLocIds, failedLocIds, downloadingLocId, retryDownload };
+  return { pendingLocIds, failedLocIds, downloadingLocIds, retryDownload };
 }
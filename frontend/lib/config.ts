@@ -1,2 +1,4 @@
 export const HOTSPOT_TARGET_CUTOFF = 5; // percent
 export const EBIRD_BASE_URL = "/ebird-proxy";
+export const TARGETS_API_URL =
+  "https://faas-nyc1-2ef2e6cc.doserverless.co/api/v1/web/fn-6c6abe6c-b02b-4b79-a86e-f7633e99a025/targets/get";
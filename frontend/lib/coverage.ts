@@ -27,9 +27,110 @@ type HotspotTargetData = {
   yrN: number;
 };
 
+const itemsByCodeCache = new WeakMap<HotspotTargetData, Map<string, TargetItem>>();
+
+/**
+ * Lookup of a hotspot's target items by species code.
+ * Built once per target list and reused, so repeated species lookups are O(1) instead of a scan of `items`.
+ */
+export function getItemsByCode(target: HotspotTargetData): Map<string, TargetItem> {
+  let itemsByCode = itemsByCodeCache.get(target);
+  if (!itemsByCode) {
+    itemsByCode = new Map();
+    for (const item of target.items ?? []) {
+      if (!itemsByCode.has(item.code)) itemsByCode.set(item.code, item);
+    }
+    itemsByCodeCache.set(target, itemsByCode);
+  }
+  return itemsByCode;
+}
+
+const targetsByHotspotCache = new WeakMap<HotspotTargetData[], Map<string, HotspotTargetData>>();
+
+/**
+ * Lookup of target lists by hotspot ID, built once per target set.
+ * The first list for a hotspot wins, as with `allTargets.find`.
+ */
+export function getTargetsByHotspot(allTargets: HotspotTargetData[]): Map<string, HotspotTargetData> {
+  let targetsByHotspot = targetsByHotspotCache.get(allTargets);
+  if (!targetsByHotspot) {
+    targetsByHotspot = new Map();
+    for (const target of allTargets) {
+      if (target.hotspotId && !targetsByHotspot.has(target.hotspotId)) {
+        targetsByHotspot.set(target.hotspotId, target);
+      }
+    }
+    targetsByHotspotCache.set(allTargets, targetsByHotspot);
+  }
+  return targetsByHotspot;
+}
+
+/**
+ * Trip-dates percent for a species at a saved hotspot, or 0 when the hotspot or species has no data.
+ */
+export function getTargetPercent(allTargets: HotspotTargetData[], hotspotId: string, code: string): number {
+  const target = getTargetsByHotspot(allTargets).get(hotspotId);
+  return (target && getItemsByCode(target).get(code)?.percent) ?? 0;
+}
+
+type SpeciesHotspotEntry = {
+  target: HotspotTargetData;
+  item: TargetItem;
+};
+
+const speciesIndexCache = new WeakMap<HotspotTargetData[], Map<string, SpeciesHotspotEntry[]>>();
+
+/**
+ * Inverted index of species code to the saved hotspots (and target item) where it appears.
+ * Built once per target set and reused by every species query against it.
+ */
+function getSpeciesIndex(allTargets: HotspotTargetData[]): Map<string, SpeciesHotspotEntry[]> {
+  let index = speciesIndexCache.get(allTargets);
+  if (!index) {
+    index = new Map();
+    for (const target of allTargets) {
+      if (!target.hotspotId) continue;
+      for (const item of getItemsByCode(target).values()) {
+        let entries = index.get(item.code);
+        if (!entries) {
+          entries = [];
+          index.set(item.code, entries);
+        }
+        entries.push({ target, item });
+      }
+    }
+    speciesIndexCache.set(allTargets, index);
+  }
+  return index;
+}
+
+/**
+ * The `n` entries with the highest percent, in descending order (ties keep input order).
+ * Runs in O(entries * n) instead of sorting the whole list when only the top few are needed.
+ */
+function selectTopByPercent<T extends { percent: number }>(entries: T[], n: number): T[] {
+  const top: T[] = [];
+  if (n <= 0) return top;
+
+  for (const entry of entries) {
+    if (top.length === n) {
+      if (entry.percent <= top[n - 1].percent) continue;
+      top.pop();
+    }
+    let i = top.length;
+    while (i > 0 && top[i - 1].percent < entry.percent) i--;
+    top.splice(i, 0, entry);
+  }
+
+  return top;
+}
+
+const coverageCache = new WeakMap<HotspotTargetData[], Map<number, Map<string, SpeciesCoverage>>>();
+
 /**
  * Calculate the best hotspot coverage for each species across all saved hotspots.
  * Returns a map of species code to their coverage stats.
+ * Results are cached per target set, so repeated calls with the same `allTargets` are free.
  *
  * @param allTargets - Array of hotspot target data
  * @param topN - Number of top hotspots to use for weighted average (default: 5)
@@ -38,31 +139,42 @@ export function calculateSpeciesCoverage(
   allTargets: HotspotTargetData[],
   topN: number = 5
 ): Map<string, SpeciesCoverage> {
-  // First pass: collect all hotspot data for each species
-  const speciesHotspots = new Map<string, Array<{ percent: number; N: number; hotspotId: string }>>();
-
-  for (const target of allTargets) {
-    if (!target.hotspotId) continue;
-
-    for (const item of target.items) {
-      if (!speciesHotspots.has(item.code)) {
-        speciesHotspots.set(item.code, []);
-      }
-      speciesHotspots.get(item.code)!.push({
-        percent: item.percent,
-        N: target.N,
-        hotspotId: target.hotspotId,
-      });
-    }
+  let coverageByTopN = coverageCache.get(allTargets);
+  const cached = coverageByTopN?.get(topN);
+  if (cached) return cached;
+
+  const coverage = computeSpeciesCoverage(allTargets, topN);
+  if (!coverageByTopN) {
+    coverageByTopN = new Map();
+    coverageCache.set(allTargets, coverageByTopN);
   }
+  coverageByTopN.set(topN, coverage);
+  return coverage;
+}
 
-  // Second pass: calculate stats for each species
+function computeSpeciesCoverage(allTargets: HotspotTargetData[], topN: number): Map<string, SpeciesCoverage> {
   const coverageMap = new Map<string, SpeciesCoverage>();
 
-  for (const [code, hotspots] of speciesHotspots) {
-    // Sort by percentage descending to get top hotspots
-    const sortedHotspots = hotspots.sort((a, b) => b.percent - a.percent);
-    const topHotspots = sortedHotspots.slice(0, topN);
+  // Single pass per species over only the hotspots where it appears, collecting every stat at once
+  for (const [code, entries] of getSpeciesIndex(allTargets)) {
+    const hotspots: Array<{ percent: number; N: number; hotspotId: string }> = [];
+    let maxObservations = 0;
+    let maxObservationsYr = 0;
+    let maxPercentYr = 0;
+
+    for (const { target, item } of entries) {
+      hotspots.push({ percent: item.percent, N: target.N, hotspotId: target.hotspotId! });
+      const obsYr = (item.percentYr * target.yrN) / 100;
+      if (obsYr > maxObservationsYr) maxObservationsYr = obsYr;
+      if (item.percentYr > maxPercentYr) maxPercentYr = item.percentYr;
+      const obs = (item.percent * target.N) / 100;
+      if (obs > maxObservations) maxObservations = obs;
+    }
+
+    // Top hotspots by percentage, descending (always at least one so the best hotspot is known)
+    const rankedHotspots = selectTopByPercent(hotspots, Math.max(topN, 1));
+    const topHotspots = rankedHotspots.slice(0, topN);
+    const best = rankedHotspots[0];
 
     // Calculate weighted average using number of checklists as weight
     let totalWeightedPercent = 0;
@@ -75,25 +187,6 @@ export function calculateSpeciesCoverage(
 
     const weightedAvgPercent = totalChecklists > 0 ? totalWeightedPercent / totalChecklists : 0;
 
-    // Find max values from all hotspots (not just top N)
-    const best = sortedHotspots[0];
-    let maxObservations = 0;
-    let maxObservationsYr = 0;
-    let maxPercentYr = 0;
-
-    // Re-scan for year-based stats
-    for (const target of allTargets) {
-      if (!target.hotspotId) continue;
-      const item = target.items.find((it) => it.code === code);
-      if (item) {
-        const obsYr = (item.percentYr * target.yrN) / 100;
-        if (obsYr > maxObservationsYr) maxObservationsYr = obsYr;
-        if (item.percentYr > maxPercentYr) maxPercentYr = item.percentYr;
-        const obs = (item.percent * target.N) / 100;
-        if (obs > maxObservations) maxObservations = obs;
-      }
-    }
-
     coverageMap.set(code, {
       code,
       maxPercent: best?.percent || 0,
@@ -139,7 +232,7 @@ export function getHotspotSpeciesImportance(
   hotspotId: string
 ): Map<string, HotspotSpeciesImportance> {
   const coverage = calculateSpeciesCoverage(allTargets);
-  const hotspotTarget = allTargets.find((t) => t.hotspotId === hotspotId);
+  const hotspotTarget = getTargetsByHotspot(allTargets).get(hotspotId);
   const result = new Map<string, HotspotSpeciesImportance>();
 
   if (!hotspotTarget?.items?.length) return result;
@@ -180,9 +273,6 @@ export function getDaySpeciesImportance(
     for (const item of t.items ?? []) speciesCodes.add(item.code);
   }
 
-  const getPercent = (hotspotId: string, code: string): number =>
-    allTargets.find((t) => t.hotspotId === hotspotId)?.items.find((it) => it.code === code)?.percent ?? 0;
-
   for (const code of speciesCodes) {
     const dayBestPercents: { dayIndex: number; bestPercent: number }[] = [];
     for (let dayIndex = 0; dayIndex < itinerary.length; dayIndex++) {
@@ -192,7 +282,7 @@ export function getDaySpeciesImportance(
         .map((loc) => loc.locationId);
       let bestPercent = 0;
       for (const hid of hotspotIds) {
-        const p = getPercent(hid, code);
+        const p = getTargetPercent(allTargets, hid, code);
         if (p > bestPercent) bestPercent = p;
       }
       dayBestPercents.push({ dayIndex, bestPercent });
@@ -220,9 +310,43 @@ export type BestHotspotRow = {
   hotspotId: string;
   hotspotName: string;
   percent: number;
+  percentYr: number;
   N: number;
+  yrN: number;
 };
 
+/**
+ * Rank saved hotspots by a species' trip-dates (`percent`) or all-year (`percentYr`) frequency,
+ * visiting only the hotspots where it appears and keeping rows whose frequency passes `include`.
+ */
+export function rankHotspotsForSpecies(
+  speciesCode: string,
+  allTargets: HotspotTargetData[],
+  locationIds: string[],
+  hotspots: { id: string; name: string }[],
+  include: (percent: number) => boolean,
+  field: "percent" | "percentYr" = "percent"
+): BestHotspotRow[] {
+  const locationIdSet = new Set(locationIds);
+  const hotspotNames = new Map(hotspots.map((h) => [h.id, h.name] as const));
+  const rows: BestHotspotRow[] = [];
+
+  for (const { target, item } of getSpeciesIndex(allTargets).get(speciesCode) ?? []) {
+    const hotspotId = target.hotspotId!;
+    if (!locationIdSet.has(hotspotId) || !include(item[field])) continue;
+    rows.push({
+      hotspotId,
+      hotspotName: hotspotNames.get(hotspotId) ?? "Hotspot",
+      percent: item.percent,
+      percentYr: item.percentYr,
+      N: target.N,
+      yrN: target.yrN,
+    });
+  }
+
+  return rows.sort((a, b) => b[field] - a[field]);
+}
+
 /**
  * Best saved hotspots for a species (trip dates only).
  * Returns ranked list of hotspots where species is >= cutoff, sorted by percent descending.
@@ -233,24 +357,13 @@ export function getBestHotspotsForSpecies(
   locationIds: string[],
   hotspots: { id: string; name: string }[]
 ): BestHotspotRow[] {
-  return allTargets
-    .filter(
-      (t) =>
-        t.hotspotId &&
-        locationIds.includes(t.hotspotId) &&
-        (t.items.find((it) => it.code === speciesCode)?.percent ?? 0) >= HOTSPOT_TARGET_CUTOFF
-    )
-    .map((t) => {
-      const item = t.items.find((it) => it.code === speciesCode);
-      const hotspot = hotspots.find((h) => h.id === t.hotspotId);
-      return {
-        hotspotId: t.hotspotId!,
-        hotspotName: hotspot?.name ?? "Hotspot",
-        percent: item?.percent ?? 0,
-        N: t.N,
-      };
-    })
-    .sort((a, b) => b.percent - a.percent);
+  return rankHotspotsForSpecies(
+    speciesCode,
+    allTargets,
+    locationIds,
+    hotspots,
+    (percent) => percent >= HOTSPOT_TARGET_CUTOFF
+  );
 }
 
 /**
@@ -263,22 +376,5 @@ export function getAllHotspotsForSpecies(
   locationIds: string[],
   hotspots: { id: string; name: string }[]
 ): BestHotspotRow[] {
-  return allTargets
-    .filter(
-      (t) =>
-        t.hotspotId &&
-        locationIds.includes(t.hotspotId) &&
-        (t.items.find((it) => it.code === speciesCode)?.percent ?? 0) > 0
-    )
-    .map((t) => {
-      const item = t.items.find((it) => it.code === speciesCode);
-      const hotspot = hotspots.find((h) => h.id === t.hotspotId);
-      return {
-        hotspotId: t.hotspotId!,
-        hotspotName: hotspot?.name ?? "Hotspot",
-        percent: item?.percent ?? 0,
-        N: t.N,
-      };
-    })
-    .sort((a, b) => b.percent - a.percent);
+  return rankHotspotsForSpecies(speciesCode, allTargets, locationIds, hotspots, (percent) => percent > 0);
 }
@@ -9,6 +9,10 @@ export {
   getDaySpeciesImportance,
   getBestHotspotsForSpecies,
   getAllHotspotsForSpecies,
+  rankHotspotsForSpecies,
+  getItemsByCode,
+  getTargetsByHotspot,
+  getTargetPercent,
   type SpeciesCoverage,
   type HotspotSpeciesImportance,
   type DaySpeciesImportance,
@@ -43,11 +43,11 @@ function escapeCsvField(value: string): string {
 }
 
 function buildExportCsv(rows: { name: string; percent: number }[]): string {
-  const header = "Species,% chance";
-  const body = rows
-    .map((r) => `${escapeCsvField(r.name)},${r.percent.toFixed(1)}`)
-    .join("\n");
-  return `${header}\n${body}`;
+  let csv = "Species,% chance";
+  for (const { name, percent } of rows) {
+    csv += `\n${escapeCsvField(name)},${percent.toFixed(1)}`;
+  }
+  return csv;
 }
 
 function downloadCsv(csv: string, filename: string) {
@@ -172,7 +172,8 @@ export default function TripTargets() {
     );
   };
 
-  const exportRows = React.useMemo(() => {
+  // Only built when downloading; the inputs change on every render so memoizing never hits
+  const getExportRows = () => {
     if (exportScope === "targets") {
       if (!targetSpecies?.length) return [];
       return targetSpecies
@@ -188,22 +189,17 @@ export default function TripTargets() {
     const codeToName = new Map<string, string>();
     for (const t of allTargets) {
       for (const item of t.items ?? []) {
-        if (!codeToName.has(item.code)) codeToName.set(item.code, item.name);
+        codeToName.set(item.code, item.name);
       }
     }
     return [...speciesCoverage.entries()]
       .filter(([, cov]) => cov.weightedAvgPercent >= exportThreshold)
       .map(([code, cov]) => ({ name: codeToName.get(code) ?? code, percent: cov.weightedAvgPercent }))
       .sort((a, b) => b.percent - a.percent);
-  }, [
-    exportScope,
-    exportThreshold,
-    targetSpecies,
-    speciesCoverage,
-    allTargets,
-  ]);
+  };
 
   const handleDownloadCsv = () => {
+    const exportRows = getExportRows();
     if (exportRows.length === 0) {
       toast.error(
         exportScope === "targets"
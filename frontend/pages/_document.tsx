@@ -1,4 +1,5 @@
 import Document, { Html, Head, Main, NextScript } from "next/document";
+import { TARGETS_API_URL } from "lib/config";
 
 class MyDocument extends Document {
   render() {
@@ -21,6 +22,7 @@ class MyDocument extends Document {
           <meta property="og:locale" content="en_US" />
           <link rel="preconnect" href="https://fonts.googleapis.com" />
           <link rel="preconnect" href="https://fonts.gstatic.com" />
+          <link rel="preconnect" href={new URL(TARGETS_API_URL).origin} crossOrigin="anonymous" />
           <meta name="theme-color" content="#ffffff" />
           <link rel="manifest" href="/manifest.json"></link>
           <link
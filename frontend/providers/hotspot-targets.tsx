@@ -40,14 +40,22 @@ const HotspotTargetsProvider = ({ children }: Props) => {
   );
 };
 
+// Cached per query result so every consumer shares one array, and lookups keyed on allTargets are reused
+const cleanedTargetsCache = new WeakMap<TargetList[], TargetList[]>();
+const noTargets: TargetList[] = [];
+
 const cleanTargets = (targets: TargetList[]) => {
+  const cached = cleanedTargetsCache.get(targets);
+  if (cached) return cached;
   const encounteredIds = new Set<string>();
-  return targets.filter((target) => {
+  const cleaned = targets.filter((target) => {
     if (!target.hotspotId) return false;
     if (encounteredIds.has(target.hotspotId)) return false;
     encounteredIds.add(target.hotspotId);
     return true;
   });
+  cleanedTargetsCache.set(targets, cleaned);
+  return cleaned;
 };
 
 const useHotspotTargets = () => {
@@ -63,7 +71,7 @@ const useHotspotTargets = () => {
     refetchOnWindowFocus: false,
   });
 
-  const targets = cleanTargets(data || []);
+  const targets = data ? cleanTargets(data) : noTargets;
 
   return { ...state, allTargets: targets };
 };